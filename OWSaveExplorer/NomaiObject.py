@@ -1,9 +1,39 @@
 #!/usr/bin/env python
 
+import re
+from dataclasses import dataclass
 from enum import Enum
-from typing import Optional
+from typing import Optional, Union
 
-from bs4 import Tag
+from bs4 import BeautifulSoup, FeatureNotFound, SoupStrainer, Tag
+
+try:
+    from lxml import etree
+
+    _PARSER = 'lxml-xml'
+except ImportError:
+    etree = None
+    _PARSER = 'html.parser'
+
+
+_STRAINER = SoupStrainer(['NomaiObject', 'TextBlock', 'ShipLogConditions'])
+
+_ESC = re.compile(r'\\u([0-9a-fA-F]{4})')
+
+
+def _unescape(s: str) -> str:
+    """Resolve literal \\uXXXX escapes, skipping the codec machinery when there are none."""
+    if '\\u' not in s:
+        return s
+    return _ESC.sub(lambda m: chr(int(m.group(1), 16)), s)
+
+
+def make_soup(markup: Union[str, bytes], parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+    """Parse Nomai XML, preferring the lxml backend when available."""
+    try:
+        return BeautifulSoup(markup, _PARSER, parse_only=parse_only)
+    except FeatureNotFound:
+        return BeautifulSoup(markup, 'html.parser', parse_only=parse_only)
 
 
 class LocationEnum(Enum):
@@ -12,53 +42,77 @@ class LocationEnum(Enum):
     LocationB = 2
 
 
+_LOC = {
+    'LocationA': LocationEnum.LocationA,
+    'LocationB': LocationEnum.LocationB,
+}
+
+
+def _location_of_lxml(el: 'etree._Element') -> LocationEnum:
+    for child in el:
+        location = _LOC.get(child.tag)
+        if location is not None:
+            return location
+    return LocationEnum.Default
+
+
+@dataclass(frozen=True, slots=True, repr=False)
 class TextBlock:
-    def __init__(
-        self,
-        idnum: int,
-        text: str,
-        parentID: Optional[int] = None,
-        location: LocationEnum = LocationEnum.Default,
-        defaultFontOverride: bool = False,
-    ) -> None:
-        self.id = idnum
-        self.text = text
-        self.parentID = parentID
-        self.location = location
-        self.defaultFontOverride = defaultFontOverride
+    id: int
+    text: str
+    parentID: Optional[int] = None
+    location: LocationEnum = LocationEnum.Default
+    defaultFontOverride: bool = False
 
     @classmethod
     def from_tag(cls, tag: Tag) -> 'NomaiObject':
         if not tag:
             return None
-        idnum = int(tag.select_one('ID').text)
-        text = tag.select_one('Text').text.strip().encode('raw_unicode_escape').decode('unicode_escape')
+        idnum = int(tag.find('ID', recursive=False).text)
+        text = _unescape(tag.find('Text', recursive=False).text.strip())
 
-        parentID = tag.select_one('ParentID')
+        parentID = tag.find('ParentID', recursive=False)
         if parentID:
             parentID = int(parentID.text)
 
         location = LocationEnum.Default
-        if tag.select_one('LocationA'):
-            location = LocationEnum.LocationA
-        elif tag.select_one('LocationB'):
-            location = LocationEnum.LocationB
+        loc_tag = tag.find(['LocationA', 'LocationB'], recursive=False)
+        if loc_tag:
+            location = _LOC[loc_tag.name]
+
+        defaultFontOverride = bool(tag.find('DefaultFontOverride', recursive=False))
+
+        return cls(idnum, text, parentID, location, defaultFontOverride)
+
+    @classmethod
+    def from_lxml(cls, el: 'etree._Element') -> Optional['TextBlock']:
+        if el is None:
+            return None
+        idnum = int(el.findtext('ID'))
+        text = _unescape(el.findtext('Text').strip())
 
-        defaultFontOverride = bool(tag.select_one('DefaultFontOverride'))
+        parentID = el.findtext('ParentID')
+        if parentID is not None:
+            parentID = int(parentID)
+
+        location = _location_of_lxml(el)
+
+        defaultFontOverride = el.find('DefaultFontOverride') is not None
 
         return cls(idnum, text, parentID, location, defaultFontOverride)
 
     def __repr__(self) -> str:
-        out = f'TextBlock(id={self.id!r}, text={self.text!r}, parentID={self.parentID!r})'
+        parts = [f'TextBlock(id={self.id!r}, text={self.text!r}, parentID={self.parentID!r}']
         if self.location != LocationEnum.Default:
-            out += f', location={self.location!r}'
+            parts.append(f'location={self.location!r}')
         if self.defaultFontOverride:
-            out += f', defaultFontOverride={self.defaultFontOverride!r}'
-        out += ')'
-        return out
+            parts.append(f'defaultFontOverride={self.defaultFontOverride!r}')
+        return ', '.join(parts) + ')'
 
 
 class RevealFact:
+    __slots__ = ('factID', 'conditions')
+
     def __init__(self, factID: str, conditions: Optional[list[int]]) -> None:
         self.factID = factID
         self.conditions = conditions if conditions is not None else []
@@ -67,17 +121,29 @@ class RevealFact:
     def from_tag(cls, tag: Tag) -> 'RevealFact':
         if not tag:
             return None
-        factID = tag.select_one('FactID').text.strip()
-        conditions = tag.select_one('Condition')
+        factID = tag.find('FactID', recursive=False).text.strip()
+        conditions = tag.find('Condition', recursive=False)
         conditions = [int(x) for x in conditions.text.split(',') if x] if conditions else []
 
         return cls(factID, conditions)
 
+    @classmethod
+    def from_lxml(cls, el: 'etree._Element') -> Optional['RevealFact']:
+        if el is None:
+            return None
+        factID = el.findtext('FactID').strip()
+        conditions = el.findtext('Condition')
+        conditions = [int(x) for x in conditions.split(',') if x] if conditions else []
+
+        return cls(factID, conditions)
+
     def __repr__(self) -> str:
         return f'RevealFact(factID={self.factID!r}, conditions={self.conditions!r})'
 
 
 class ShipLogConditions:
+    __slots__ = ('facts', 'location')
+
     def __init__(self, facts: list[RevealFact], location: LocationEnum = LocationEnum.Default) -> None:
         self.facts = facts
         self.location = location
@@ -86,12 +152,20 @@ class ShipLogConditions:
     def from_tag(cls, tag: Tag) -> 'ShipLogConditions':
         if not tag:
             return None
-        facts = [RevealFact.from_tag(tag) for tag in tag.select('RevealFact')]
+        facts = [RevealFact.from_tag(tag) for tag in tag.find_all('RevealFact', recursive=False)]
         location = LocationEnum.Default
-        if tag.select_one('LocationA'):
-            location = LocationEnum.LocationA
-        elif tag.select_one('LocationB'):
-            location = LocationEnum.LocationB
+        loc_tag = tag.find(['LocationA', 'LocationB'], recursive=False)
+        if loc_tag:
+            location = _LOC[loc_tag.name]
+
+        return cls(facts, location)
+
+    @classmethod
+    def from_lxml(cls, el: 'etree._Element') -> Optional['ShipLogConditions']:
+        if el is None:
+            return None
+        facts = [RevealFact.from_lxml(e) for e in el.findall('RevealFact')]
+        location = _location_of_lxml(el)
 
         return cls(facts, location)
 
@@ -100,20 +174,52 @@ class ShipLogConditions:
 
 
 class NomaiObject:
+    __slots__ = ('_textblocks', '_raw_textblocks', 'shipLogConditions')
+
     def __init__(
         self,
         textblocks: list[TextBlock],
         shipLogConditions: Optional[ShipLogConditions] = None,
     ) -> None:
-        self.textblocks = textblocks
+        self._textblocks = textblocks
+        self._raw_textblocks = None
         self.shipLogConditions = shipLogConditions
 
+    @property
+    def textblocks(self) -> list[TextBlock]:
+        # Materialized lazily so callers that only need shipLogConditions
+        # never pay for TextBlock construction.
+        if self._raw_textblocks is not None:
+            loader, elements = self._raw_textblocks
+            self._textblocks = [loader(e) for e in elements]
+            self._raw_textblocks = None
+        return self._textblocks
+
     @classmethod
     def from_tag(cls, tag: Tag) -> "NomaiObject":
-        textblocks = [TextBlock.from_tag(tag) for tag in tag.select('TextBlock')]
-        shipLogConditions = ShipLogConditions.from_tag(tag.select_one('ShipLogConditions'))
+        shipLogConditions = ShipLogConditions.from_tag(tag.find('ShipLogConditions', recursive=False))
+
+        obj = cls([], shipLogConditions)
+        obj._raw_textblocks = (TextBlock.from_tag, tag.find_all('TextBlock', recursive=False))
+        return obj
 
-        return cls(textblocks, shipLogConditions)
+    @classmethod
+    def from_lxml(cls, el: 'etree._Element') -> 'NomaiObject':
+        shipLogConditions = ShipLogConditions.from_lxml(el.find('ShipLogConditions'))
+
+        obj = cls([], shipLogConditions)
+        obj._raw_textblocks = (TextBlock.from_lxml, el.findall('TextBlock'))
+        return obj
+
+    @classmethod
+    def from_xml(cls, data: Union[str, bytes]) -> 'NomaiObject':
+        if etree is not None:
+            return cls.from_lxml(etree.fromstring(data))
+        return cls.parse(data)
+
+    @classmethod
+    def parse(cls, data: Union[str, bytes]) -> 'NomaiObject':
+        return cls.from_tag(make_soup(data, parse_only=_STRAINER).find('NomaiObject'))
 
     def __repr__(self) -> str:
         return f'NomaiObject(textblocks={self.textblocks!r}, shipLogConditions={self.shipLogConditions!r})'
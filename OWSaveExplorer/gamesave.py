@@ -2,12 +2,24 @@
 
 import logging
 from collections.abc import Iterator
-from io import TextIOBase
-from json import dumps, loads
+from dataclasses import dataclass
+from io import IOBase, TextIOBase
 from pathlib import Path
 from pprint import PrettyPrinter
 from typing import Any, Optional, Union
 
+try:
+    from orjson import dumps as _dumps_bytes
+    from orjson import loads
+
+    def dumps(data: Any) -> str:
+        return _dumps_bytes(data).decode()
+except ImportError:
+    from json import dumps, loads
+
+    def _dumps_bytes(data: Any) -> bytes:
+        return dumps(data).encode()
+
 from OWSaveExplorer.enums import (
     DeathTypeEnum,
     FrequencyEnum,
@@ -19,36 +31,56 @@ from OWSaveExplorer.util import Tristate
 
 logger = logging.getLogger('gamesave')
 
+# int -> member tables; Enum.__call__ goes through the metaclass per lookup.
+_FREQ_BY_INT = {m.value: m for m in FrequencyEnum}
+# Members in list-index order; knownFrequencies is stored as a JSON array.
+_FREQ_ORDER = tuple(_FREQ_BY_INT[n] for n in range(7))
+_DEATH_BY_INT = {m.value: m for m in DeathTypeEnum}
+# knownSignals keys are decimal strings in the JSON; map them straight to
+# members (and back) without the int() parse in between.
+_SIGNAL_BY_STR = {str(m.value): m for m in SignalEnum}
+_SIGNAL_KEY = {m: str(m.value) for m in SignalEnum}
+
+# Default dict contents are constant; build them once and copy() per init.
+_DEFAULT_KNOWN_FREQUENCIES = {_FREQ_BY_INT[n]: False for n in range(7)}
+_DEFAULT_KNOWN_FREQUENCIES[FrequencyEnum._] = True
+_DEFAULT_KNOWN_SIGNALS = {m: False for m in SignalEnum}
+_RUMOR_IDS = tuple(rumors)
+
+# Fixed column widths for pprint_GameSave; the vocabularies never change.
+_FREQ_NAME_WIDTH = max(len(m.name) for m in FrequencyEnum)
+_SIG_NAME_WIDTH = max(len(m.name) for m in SignalEnum)
+_COND_NAME_WIDTH = max(len(c) for c in persistent_conditions)
+
+
+def _shiplog_sort_key(item: tuple[str, 'ShipLogFactSave']) -> tuple[int, str]:
+    return (item[1].revealOrder, item[0])
+
+
+@dataclass(slots=True)
 class ShipLogFactSave:
-    def __init__(
-        self,
-        id_: str,
-        revealOrder: int = -1,
-        read: bool = False,
-        newlyRevealed: bool = False,
-    ) -> None:
-        self.id = id_
-        self.revealOrder = revealOrder
-        self.read = read
-        self.newlyRevealed = newlyRevealed
+    id: str
+    revealOrder: int = -1
+    read: bool = False
+    newlyRevealed: bool = False
 
     @classmethod
     def from_dict(cls, data: dict) -> 'ShipLogFactSave':
-        return cls(data['id'], data['revealOrder'], data['read'], data['newlyRevealed'])
+        return cls(**data)
 
-    def __iter__(self) -> Iterator[tuple[str, Any]]:
-        yield from {
+    def to_dict(self) -> dict[str, Any]:
+        return {
             'id': self.id,
             'revealOrder': self.revealOrder,
             'read': self.read,
             'newlyRevealed': self.newlyRevealed,
-        }.items()
+        }
 
-    def __repr__(self) -> str:
-        return (
-            f'ShipLogFactSave(id={self.id!r}, revealOrder={self.revealOrder}, read={self.read}, '
-            f'newlyRevealed={self.newlyRevealed})'
-        )
+    def __iter__(self) -> Iterator[tuple[str, Any]]:
+        yield 'id', self.id
+        yield 'revealOrder', self.revealOrder
+        yield 'read', self.read
+        yield 'newlyRevealed', self.newlyRevealed
 
 
 # class ShipLogFactSavesNode:
@@ -64,20 +96,14 @@ class GameSave:
     def __init__(self) -> None:
         self.loopCount: int = 1
 
-        self.knownFrequencies: dict[FrequencyEnum, bool] = {}
-        for i in range(7):
-            self.knownFrequencies[FrequencyEnum(i)] = False
-        self.knownFrequencies[FrequencyEnum._] = True
-
-        self.knownSignals: dict[SignalEnum, bool] = {}
-        for signal in list(SignalEnum):
-            self.knownSignals[signal] = False
+        self.knownFrequencies: dict[FrequencyEnum, bool] = _DEFAULT_KNOWN_FREQUENCIES.copy()
+        self.knownSignals: dict[SignalEnum, bool] = _DEFAULT_KNOWN_SIGNALS.copy()
 
         self.dictConditions: dict[str, Tristate] = {}
 
-        self.shipLogFactSaves: dict[str, ShipLogFactSave] = {}
-        for fact in rumors:
-            self.shipLogFactSaves[fact] = ShipLogFactSave(id_=fact)
+        self.shipLogFactSaves: dict[str, ShipLogFactSave] = {
+            fact: ShipLogFactSave(id=fact) for fact in _RUMOR_IDS
+        }
 
         self.newlyRevealedFactIDs: list[str] = []
         self.lastDeathType: DeathTypeEnum = DeathTypeEnum.DEFAULT
@@ -94,28 +120,27 @@ class GameSave:
         self.didRunInitGammaSetting: bool = False
 
     @classmethod
-    def from_json(cls, json: Union[str, TextIOBase]) -> 'GameSave':
+    def from_json(cls, json: Union[str, bytes, IOBase]) -> 'GameSave':
         save = cls()
-        if isinstance(json, TextIOBase):
+        if isinstance(json, IOBase):
+            # Binary files hand loads() bytes directly; no utf-8 roundtrip.
             json = json.read()
 
         data = loads(json)
         save.loopCount = data['loopCount']
 
-        for k, v in enumerate(data['knownFrequencies']):
-            save.knownFrequencies[FrequencyEnum(int(k))] = v
+        save.knownFrequencies.update(zip(_FREQ_ORDER, data['knownFrequencies']))
+        save.knownSignals.update({_SIGNAL_BY_STR[k]: v for k, v in data['knownSignals'].items()})
 
-        for k, v in data['knownSignals'].items():
-            save.knownSignals[SignalEnum(int(k))] = v
+        conditions = data['dictConditions']
+        save.dictConditions = {c: Tristate(conditions.get(c)) for c in persistent_conditions}
 
-        for condition in persistent_conditions:
-            save.dictConditions[condition] = Tristate(data['dictConditions'].get(condition))
-
-        for k, v in data['shipLogFactSaves'].items():
-            save.shipLogFactSaves[k] = ShipLogFactSave.from_dict(v)
+        save.shipLogFactSaves.update(
+            {k: ShipLogFactSave(**v) for k, v in data['shipLogFactSaves'].items()}
+        )
 
         save.newlyRevealedFactIDs = data['newlyRevealedFactIDs']
-        save.lastDeathType = DeathTypeEnum(data['lastDeathType'])
+        save.lastDeathType = _DEATH_BY_INT[data['lastDeathType']]
         save.burnedMarshmallowEaten = data['burnedMarshmallowEaten']
         save.fullTimeloops = data['fullTimeloops']
         save.perfectMarshmallowsEaten = data['perfectMarshmallowsEaten']
@@ -130,66 +155,64 @@ class GameSave:
 
         return save
 
-    def to_json(self) -> str:
-        data = {}
-        data['loopCount'] = self.loopCount
-
-        data['knownFrequencies']: list[bool] = [self.knownFrequencies[FrequencyEnum(n)] for n in range(7)]
-
-        data['knownSignals']: dict[SignalEnum, bool] = {}
-        for signal, v in self.knownSignals.items():
-            data['knownSignals'][str(int(signal))] = v
-
-        data['dictConditions'] = {}
-        for condition, v in self.dictConditions.items():
-            if v is not None and v.value is not None:
-                data['dictConditions'][condition] = v.value
-
-        data['shipLogFactSaves'] = {}
-        for k, v in self.shipLogFactSaves.items():
-            data['shipLogFactSaves'][k] = dict(v)
-
-        data['newlyRevealedFactIDs'] = self.newlyRevealedFactIDs
-        data['lastDeathType'] = int(self.lastDeathType)
+    def _to_dict(self) -> dict[str, Any]:
+        return {
+            'loopCount': self.loopCount,
+            'knownFrequencies': [self.knownFrequencies[m] for m in _FREQ_ORDER],
+            'knownSignals': {_SIGNAL_KEY[signal]: v for signal, v in self.knownSignals.items()},
+            'dictConditions': {
+                condition: v.value
+                for condition, v in self.dictConditions.items()
+                if v is not None and v.value is not None
+            },
+            'shipLogFactSaves': {k: v.to_dict() for k, v in self.shipLogFactSaves.items()},
+            'newlyRevealedFactIDs': self.newlyRevealedFactIDs,
+            'lastDeathType': int(self.lastDeathType),
+            'burnedMarshmallowEaten': self.burnedMarshmallowEaten,
+            'fullTimeloops': self.fullTimeloops,
+            'perfectMarshmallowsEaten': self.perfectMarshmallowsEaten,
+            'warpedToTheEye': self.warpedToTheEye,
+            'secondsRemainingOnWarp': self.secondsRemainingOnWarp,
+            'loopCountOnParadox': self.loopCountOnParadox,
+            'shownPopups': int(self.shownPopups),
+            'version': self.version,
+            'ps5Activity_canResumeExpedition': self.ps5Activity_canResumeExpedition,
+            'ps5Activity_availableShipLogCards': self.ps5Activity_availableShipLogCards,
+            'didRunInitGammaSetting': self.didRunInitGammaSetting,
+        }
 
-        data['burnedMarshmallowEaten'] = self.burnedMarshmallowEaten
-        data['fullTimeloops'] = self.fullTimeloops
-        data['perfectMarshmallowsEaten'] = self.perfectMarshmallowsEaten
-        data['warpedToTheEye'] = self.warpedToTheEye
-        data['secondsRemainingOnWarp'] = self.secondsRemainingOnWarp
-        data['loopCountOnParadox'] = self.loopCountOnParadox
-        data['shownPopups'] = int(self.shownPopups)
-        data['version'] = self.version
-        data['ps5Activity_canResumeExpedition'] = self.ps5Activity_canResumeExpedition
-        data['ps5Activity_availableShipLogCards'] = self.ps5Activity_availableShipLogCards
-        data['didRunInitGammaSetting'] = self.didRunInitGammaSetting
-
-        self.from_json(dumps(data))
-
-        return dumps(data)
+    def to_json(self) -> str:
+        return dumps(self._to_dict())
 
     def save(self, file: str | Path | TextIOBase) -> None:
-        if isinstance(file, str):
-            file = Path(file).open('w')  # noqa: SIM115
-        elif isinstance(file, Path):
-            file = file.open('w')
-        elif not isinstance(file, str):
+        if isinstance(file, (str, Path)):
+            # Bytes end-to-end: skips the str materialisation and the
+            # TextIOWrapper re-encode on write.
+            Path(file).write_bytes(_dumps_bytes(self._to_dict()))
+        elif isinstance(file, TextIOBase):
+            file.write(self.to_json())
+        else:
             raise ValueError('"file" argument must be a str, Path, or TextIOBase')
 
-        json = self.to_json()
-        file.write(json)
-
     def __repr__(self) -> str:
-        out = 'GameSave('
-        out += f'loopCount={self.loopCount}, knownFrequencies={{...}}, '
-        out += 'knownSignals={{...}}, dictConditions={{...}}, shipLogFactSaves={{...}}, '
-        out += f'self.newlyRevealedFactIDs = [...], lastDeathType={self.lastDeathType}, '
-        out += f'burnedMarshmallowEaten={self.burnedMarshmallowEaten}, fullTimeloops={self.fullTimeloops}, '
-        out += f'perfectMarshmallowsEaten={self.perfectMarshmallowsEaten}, warpedToTheEye={self.warpedToTheEye}, '
-        out += f'secondsRemainingOnWarp={self.secondsRemainingOnWarp}, loopCountOnParadox={self.loopCountOnParadox}, '
-        out += f'shownPopups={self.shownPopups}, version={self.version}'
-        out += ')'
-        return out
+        parts = (
+            f'loopCount={self.loopCount}',
+            'knownFrequencies={...}',
+            'knownSignals={...}',
+            'dictConditions={...}',
+            'shipLogFactSaves={...}',
+            'newlyRevealedFactIDs=[...]',
+            f'lastDeathType={self.lastDeathType}',
+            f'burnedMarshmallowEaten={self.burnedMarshmallowEaten}',
+            f'fullTimeloops={self.fullTimeloops}',
+            f'perfectMarshmallowsEaten={self.perfectMarshmallowsEaten}',
+            f'warpedToTheEye={self.warpedToTheEye}',
+            f'secondsRemainingOnWarp={self.secondsRemainingOnWarp}',
+            f'loopCountOnParadox={self.loopCountOnParadox}',
+            f'shownPopups={self.shownPopups}',
+            f'version={self.version}',
+        )
+        return 'GameSave(' + ', '.join(parts) + ')'
 
 
 if isinstance(PrettyPrinter._dispatch, dict):
@@ -203,49 +226,52 @@ if isinstance(PrettyPrinter._dispatch, dict):
         context: dict,
         level: int,
     ) -> None:
-        stream.write('GameSave(\n')
         ipl = printer._indent_per_level + 1
         indent += printer._indent_per_level  # len(GameSave.__name__)
-        stream.write(' ' * ipl + f'loopCount: {object.loopCount}\n')
 
-        stream.write(' ' * ipl + 'knownFrequencies:\n')
-        max_len = max(len(x.name) for x in FrequencyEnum)
+        ind1 = ' ' * ipl
+        ind2 = ' ' * (ipl * 2)
+
+        # Buffer everything and write once; per-line stream.write calls add up.
+        parts = ['GameSave(\n']
+        parts.append(ind1 + f'loopCount: {object.loopCount}\n')
+
+        parts.append(ind1 + 'knownFrequencies:\n')
+        max_len = _FREQ_NAME_WIDTH
         for n, v in enumerate(object.knownFrequencies):
-            stream.write(' ' * (ipl * 2))
-            stream.write(f'{FrequencyEnum(n).name.ljust(max_len)}: {v}\n')
+            parts.append(ind2 + f'{FrequencyEnum(n).name.ljust(max_len)}: {v}\n')
 
-        stream.write(' ' * ipl + 'knownSignals:\n')
-        max_len = max(len(x.name) for x in object.knownSignals)
+        parts.append(ind1 + 'knownSignals:\n')
+        max_len = _SIG_NAME_WIDTH
         for k, v in object.knownSignals.items():
-            stream.write(' ' * (ipl * 2))
-            stream.write(f'{k.name.ljust(max_len)}: {v}\n')
+            parts.append(ind2 + f'{k.name.ljust(max_len)}: {v}\n')
 
-        stream.write(' ' * ipl + 'dictConditions:\n')
-        max_len = max(len(x) for x in object.dictConditions)
+        parts.append(ind1 + 'dictConditions:\n')
+        max_len = _COND_NAME_WIDTH
         for k, v in object.dictConditions.items():
-            stream.write(' ' * (ipl * 2))
-            stream.write(f'{k.ljust(max_len)}: {v}\n')
+            parts.append(ind2 + f'{k.ljust(max_len)}: {v}\n')
 
-        stream.write(' ' * ipl + 'shipLogFactSaves:\n')
-        max_len = max(len(x) for x in object.dictConditions)
-        items = list(object.shipLogFactSaves.items())
-        items.sort(key=lambda x: (x[1].revealOrder, x[0]))
+        parts.append(ind1 + 'shipLogFactSaves:\n')
+        max_len = max(map(len, object.shipLogFactSaves))
+        items = sorted(object.shipLogFactSaves.items(), key=_shiplog_sort_key)
         for k, v in items:
-            stream.write(' ' * (ipl * 2))
             read = ' read' if v.read else ''
             newlyRevealed = ' newlyRevealed' if v.newlyRevealed else ''
-            stream.write(f'{k.ljust(max_len)}: revealOrder={v.revealOrder:<3}{read}{newlyRevealed}\n')
-
-        stream.write(' ' * ipl + f'lastDeathType: {object.lastDeathType}\n')
-        stream.write(' ' * ipl + f'burnedMarshmallowEaten: {object.burnedMarshmallowEaten}\n')
-        stream.write(' ' * ipl + f'fullTimeloops: {object.fullTimeloops}\n')
-        stream.write(' ' * ipl + f'perfectMarshmallowsEaten: {object.perfectMarshmallowsEaten}\n')
-        stream.write(' ' * ipl + f'warpedToTheEye: {object.warpedToTheEye}\n')
-        stream.write(' ' * ipl + f'secondsRemainingOnWarp: {object.secondsRemainingOnWarp}\n')
-        stream.write(' ' * ipl + f'loopCountOnParadox: {object.loopCountOnParadox}\n')
-        stream.write(' ' * ipl + f'shownPopups: {object.shownPopups}\n')
-        stream.write(' ' * ipl + f'version: {object.version}\n')
-
-        stream.write(')')
+            parts.append(
+                ind2 + f'{k.ljust(max_len)}: revealOrder={v.revealOrder:<3}{read}{newlyRevealed}\n'
+            )
+
+        parts.append(ind1 + f'lastDeathType: {object.lastDeathType}\n')
+        parts.append(ind1 + f'burnedMarshmallowEaten: {object.burnedMarshmallowEaten}\n')
+        parts.append(ind1 + f'fullTimeloops: {object.fullTimeloops}\n')
+        parts.append(ind1 + f'perfectMarshmallowsEaten: {object.perfectMarshmallowsEaten}\n')
+        parts.append(ind1 + f'warpedToTheEye: {object.warpedToTheEye}\n')
+        parts.append(ind1 + f'secondsRemainingOnWarp: {object.secondsRemainingOnWarp}\n')
+        parts.append(ind1 + f'loopCountOnParadox: {object.loopCountOnParadox}\n')
+        parts.append(ind1 + f'shownPopups: {object.shownPopups}\n')
+        parts.append(ind1 + f'version: {object.version}\n')
+
+        parts.append(')')
+        stream.write(''.join(parts))
 
     PrettyPrinter._dispatch[GameSave.__repr__] = pprint_GameSave
@@ -1,5 +1,6 @@
 #!/usr/bin/env python
 
+from functools import lru_cache
 from typing import Optional
 
 from rich.highlighter import ReprHighlighter
@@ -9,6 +10,15 @@ from textual.validation import Function, ValidationResult
 highlighter = ReprHighlighter()
 
 
+@lru_cache(maxsize=4096)
+def highlight_repr(s: str) -> Text:
+    """Memoized highlighter pass; repeated reprs (True, 0, ...) are highlighted once.
+
+    Callers that mutate the result (align etc.) must copy() it first.
+    """
+    return highlighter(s)
+
+
 def color_bool(val: bool, /, align_left: int = 0, align_right: int = 0) -> Text:
     text = Text.from_markup(f'[green]{val}[/]') if val else Text.from_markup(f'[red]{val}[/]')
     if align_left:
@@ -19,10 +29,21 @@ def color_bool(val: bool, /, align_left: int = 0, align_right: int = 0) -> Text:
 
 
 class Tristate:
-    def __init__(self, value: Optional[bool] = None) -> None:
-        if value not in (True, False, None):
-            raise ValueError('Value must be True, False, or None')
-        self.value = value
+    __slots__ = ('value',)
+
+    # True -> False -> None -> True toggle cycle.
+    _NEXT = {True: False, False: None, None: True}
+
+    # The three shared instances, keyed by state; filled in below the class
+    # body. Tristate(x) hands back a singleton, so building one per condition
+    # on every load allocates nothing.
+    _INTERNED: dict = {}
+
+    def __new__(cls, value: Optional[bool] = None) -> 'Tristate':
+        try:
+            return cls._INTERNED[value]
+        except (KeyError, TypeError):
+            raise ValueError('Value must be True, False, or None') from None
 
     def __eq__(self, other: object) -> bool:
         if isinstance(other, Tristate):
@@ -35,6 +56,9 @@ class Tristate:
     def __bool__(self) -> bool:
         raise TypeError('Tristate cannot be used as a bool')
 
+    def next_value(self) -> Optional[bool]:
+        return self._NEXT[self.value]
+
     def __str__(self) -> str:
         return str(self.value)
 
@@ -42,6 +66,13 @@ class Tristate:
         return f'Tristate({self.value})'
 
 
+for _state in (True, False, None):
+    _instance = object.__new__(Tristate)
+    _instance.value = _state
+    Tristate._INTERNED[_state] = _instance
+del _instance, _state
+
+
 class ValidationWrapper:
     def __init__(self, validator: Function) -> None:
         self.validator = validator
@@ -2,9 +2,9 @@
 
 import logging
 from enum import Flag
-from itertools import product
+from operator import attrgetter
 from pathlib import Path
-from typing import Callable, Optional
+from typing import Callable, Iterable, Optional
 
 from rich.text import Text
 from textual.binding import Binding
@@ -22,12 +22,60 @@ from OWSaveExplorer.enums import (
 )
 from OWSaveExplorer.gamesave import GameSave, ShipLogFactSave
 from OWSaveExplorer.strings import persistent_conditions, rumors
-from OWSaveExplorer.util import Tristate, ValidationWrapper, color_bool, highlighter
+from OWSaveExplorer.util import Tristate, ValidationWrapper, color_bool, highlight_repr
 
 logger = logging.getLogger('widgets.gamesave')
 
+# Input.restrict patterns, built once rather than per edit.
+_FLOAT_RESTRICT = r'^-?[0-9]*(?:\.[0-9]*)?$'
+_INT_RESTRICT = r'^-?[0-9]*$'
+
+# Ship log fact names are padded to the longest rumor id; constant vocabulary.
+_RUMORS_MAX_LEN = max(map(len, rumors))
+
+# (mask, name) pairs for StartupPopupsFlag; class iteration skips NONE.
+_POPUPS = tuple((f.value, f.name) for f in StartupPopupsFlag)
+
+
+def _popup_names(flags: StartupPopupsFlag) -> str:
+    value = flags.value
+    return '|'.join(name for mask, name in _POPUPS if value & mask)
+
+# Shared value transformers; one C-level callable instead of a closure
+# allocated per Entry.
+_NAME_OF = attrgetter('name')
+_VALUE_OF = attrgetter('value')
+
+# attrgetter resolves the chain in C; sorts call the key once per node.
+_SORT_KEYS = {
+    'reveal': attrgetter('data.value.revealOrder'),
+    'alpha': attrgetter('data.value.id'),
+}
+
+# Exact-type membership (not isinstance: bool and the IntEnums subclass int).
+_EDIT_TYPES = frozenset({str, int, float, ShipLogFactSave, DeathTypeEnum, StartupPopupsFlag})
+_CAST_TYPES = frozenset({bool, Tristate, DeathTypeEnum, StartupPopupsFlag})
+
 
 class Entry:
+    __slots__ = (
+        'name',
+        'value',
+        'value_transformer',
+        'mode',
+        'type',
+        'validator',
+        'enabled',
+        '_label_cache',
+        '_label_state',
+        '_label_applied',
+        '_prefix',
+        '_prefix_strike',
+    )
+
+    # Shared Text for the None value; Text.assemble copies its parts.
+    _NONE_TEXT = Text.from_markup('[yellow]None[/]')
+
     class DisplayMode(Flag):
         PLAIN = 0
         HIGHLIGHT = 1
@@ -45,43 +93,58 @@ class Entry:
     ) -> None:
         self.name = name
         self.value = value
-        self.value_transformer = value_transformer if value_transformer else lambda x: x
+        self.value_transformer = value_transformer
         self.mode = mode
         self.type = base_type
 
         self.validator = validator
         self.enabled = enabled
 
+        self._label_cache: Optional[Text] = None
+        self._label_state: Optional[tuple] = None
+        # Last label handed to the tree node, so no-op relabels can be skipped.
+        self._label_applied: Optional[Text] = None
+
+        # The name part of the label never changes; parse its markup once.
+        self._prefix = Text.from_markup(f'[b]{name}[/b]=')
+        self._prefix_strike = Text.from_markup(f'[strike][b]{name}[/b][/strike]=')
+
     def set(self, value: object) -> None:
         self.value = value
+        self._label_cache = None
 
     def get(self) -> object:
         return self.value
 
+    def _label_key(self) -> tuple:
+        value = self.value
+        if isinstance(value, list):
+            # Snapshot list contents; in-place mutation would otherwise go unseen.
+            value = tuple(value)
+        return (value, self.enabled)
+
     def get_label(self) -> Text:
-        color_prefix = color_suffix = ''
+        key = self._label_key()
+        if self._label_cache is not None and key == self._label_state:
+            return self._label_cache
+
+        label = self._render_label()
+        self._label_state = key
+        self._label_cache = label
+        return label
 
-        value = self.value_transformer(self.value)
+    def _render_label(self) -> Text:
+        value = self.value if self.value_transformer is None else self.value_transformer(self.value)
 
         if isinstance(value, bool):
             value_text = color_bool(value)
         elif value is None:
-            value_text = Text.from_markup(f'[yellow]{value}[/]')
+            value_text = self._NONE_TEXT
         else:
             s = repr(value) if self.mode & self.DisplayMode.REPR else value
-            value_text = highlighter(s) if self.mode & self.DisplayMode.HIGHLIGHT else str(s)
+            value_text = highlight_repr(s) if self.mode & self.DisplayMode.HIGHLIGHT else str(s)
 
-        if not self.enabled:
-            color_prefix += 'strike'
-
-        if color_prefix:
-            color_prefix = f'[{color_prefix}]'
-            color_suffix = '[/]'
-
-        return Text.assemble(
-            Text.from_markup(f'{color_prefix}[b]{self.name}[/b]{color_suffix}='),
-            value_text,
-        )
+        return Text.assemble(self._prefix if self.enabled else self._prefix_strike, value_text)
 
     def __repr__(self) -> str:
         return f'Entry(name={self.name!r}, value={self.value!r}, type={self.type!r})'
@@ -94,35 +157,48 @@ class Entry:
 
 
 class EntryTristate(Entry):
+    __slots__ = ()
+
+    _COLOR = {False: 'red', True: 'green', None: 'yellow'}
+
     def __init__(self, *args, **kwargs) -> None:
         self.value: Tristate
-        super().__init__(*args, value_transformer=lambda x: x.value, base_type=Tristate, **kwargs)
+        super().__init__(*args, value_transformer=_VALUE_OF, base_type=Tristate, **kwargs)
 
     def get_color(self) -> str:
-        return {False: 'red', True: 'green', None: 'yellow'}[self.value.value]
+        return self._COLOR[self.value.value]
 
 
 class EntryBool(Entry):
+    __slots__ = ()
+
+    _COLOR = {False: 'red', True: 'green'}
+
     def __init__(self, *args, **kwargs) -> None:
         self.value = False
         super().__init__(*args, base_type=bool, **kwargs)
 
     def get_color(self) -> str:
-        return {False: 'red', True: 'green'}[self.value]
+        return self._COLOR[self.value]
 
 
 class EntrySaveLogFact(Entry):
+    __slots__ = ('_pad',)
+
     def __init__(self, *args, **kwargs) -> str:
         self.value: ShipLogFactSave
         super().__init__(*args, **kwargs, base_type=ShipLogFactSave)
+        self._pad = ' ' * (_RUMORS_MAX_LEN - len(self.name) + 1)
 
-    def get_label(self) -> Text:
-        max_len = max(len(x) for x in rumors)
-        revealOrder = highlighter(repr(self.value.revealOrder))
+    def _label_key(self) -> tuple:
+        return (self.value.revealOrder, self.value.read, self.value.newlyRevealed)
+
+    def _render_label(self) -> Text:
+        revealOrder = highlight_repr(repr(self.value.revealOrder)).copy()
         revealOrder.align('left', 3)
         return Text.assemble(
-            Text.from_markup(f'[b]{self.name}[/b] '),
-            ' ' * (max_len - len(self.name)),
+            Text.from_markup(f'[b]{self.name}[/b]'),
+            self._pad,
             'revealOrder=',
             revealOrder,
             '  read=',
@@ -169,24 +245,42 @@ class GameSaveTree(Tree):
         self.root.expand()
         self.selected = None
         self.sorted_by = 'reveal'
+        self._sort_dirty = False
         self.gamesave: Optional[GameSave] = None
 
+        # Highest revealOrder in the tree, kept current by set_gamesave and
+        # submit_edit so the per-keystroke validator is O(1).
+        self._max_reveal_order = -1
+        self._reveal_order_validator = Function(self._validate_reveal_order, 'Out of range')
+
+        # Flat list of nodes carrying an Entry; update_labels iterates this
+        # instead of re-walking the tree. Rebuilt whenever leaves change.
+        self._entry_nodes: list[TreeNode] = []
+        self._labels_scheduled = False
+
         self.loopCount = self.root.add_leaf('', data=Entry('loopCount', 0, base_type=int))
         self.knownFrequencies = self.root.add('knownFrequencies')
-        for i in range(7):
-            self.knownFrequencies.add_leaf('', data=EntryBool(FrequencyEnum(i).name, False))
+        self._add_leaves(
+            self.knownFrequencies, (('', EntryBool(FrequencyEnum(i).name, False)) for i in range(7))
+        )
 
         self.knownSignals = self.root.add('knownSignals')
-        for e in SignalEnum:
-            self.knownSignals.add_leaf('', data=EntryBool(e.name, False))
+        self._add_leaves(self.knownSignals, (('', EntryBool(e.name, False)) for e in SignalEnum))
 
         self.dictConditions = self.root.add('dictConditions')
-        for condition in persistent_conditions:
-            self.dictConditions.add_leaf('', data=EntryTristate(condition, Tristate(None)))
+        self._add_leaves(
+            self.dictConditions,
+            (('', EntryTristate(condition, Tristate(None))) for condition in persistent_conditions),
+        )
 
         self.shipLogFactSaves = self.root.add('shipLogFactSaves')
         self.shipLogFactSaves.data = NamedNode('shipLogFactSaves')
 
+        # name -> node lookups so (set|update)_gamesave are single passes.
+        self._freq_nodes = {n.data.name: n for n in self.knownFrequencies.children}
+        self._signal_nodes = {n.data.name: n for n in self.knownSignals.children}
+        self._condition_nodes = {n.data.name: n for n in self.dictConditions.children}
+
         self.newlyRevealedFactIDs = self.root.add_leaf(
             'newlyRevealedFactIDs',
             data=Entry(
@@ -200,7 +294,7 @@ class GameSaveTree(Tree):
             data=Entry(
                 'lastDeathType',
                 DeathTypeEnum.DEFAULT,
-                value_transformer=lambda x: x.name,
+                value_transformer=_NAME_OF,
                 base_type=DeathTypeEnum,
                 mode=Entry.DisplayMode.PLAIN,
             ),
@@ -241,7 +335,7 @@ class GameSaveTree(Tree):
             data=Entry(
                 'shownPopups',
                 StartupPopupsFlag(0),
-                value_transformer=lambda x: '|'.join(y.name for y in x),
+                value_transformer=_popup_names,
                 base_type=StartupPopupsFlag,
                 mode=Entry.DisplayMode.PLAIN,
             ),
@@ -272,6 +366,18 @@ class GameSaveTree(Tree):
 
         self.update_labels()
 
+    def _add_leaves(self, parent: TreeNode, leaves: Iterable[tuple[str, Entry]]) -> None:
+        # Batched add_leaf: nodes are created and appended directly, with one
+        # parent update and one invalidation instead of one of each per leaf.
+        children = parent._children  # pylint: disable=protected-access
+        for label, entry in leaves:
+            node = self._add_node(parent, self.process_label(label), entry)
+            node._expanded = False  # pylint: disable=protected-access
+            node._allow_expand = False  # pylint: disable=protected-access
+            children.append(node)
+        parent._updates += 1  # pylint: disable=protected-access
+        self._invalidate()
+
     def check_action(self, action: str, parameters: tuple[object, ...]) -> bool | None:  # noqa: PLR0912
         # logger.debug('GameSaveTree.check_action(%s, %s)', action, parameters)
         # logger.debug(' - %r %r', self.selected, self.selected.data.name if self.selected.data else None)
@@ -294,11 +400,7 @@ class GameSaveTree(Tree):
             ret = self.gamesave is not None
         elif isinstance(self.selected.data, Entry):
             if action == self.Action.EDIT_VALUE:
-                ret = (
-                    type(self.selected.data.value)
-                    in (str, int, float, ShipLogFactSave, DeathTypeEnum, StartupPopupsFlag)
-                    and self.has_focus
-                )
+                ret = type(self.selected.data.value) in _EDIT_TYPES and self.has_focus
             elif action == self.Action.TOGGLE_VALUE:
                 ret = isinstance(self.selected.data.value, (Tristate, bool)) and self.has_focus
             elif action == self.Action.SET_LOG_STATE:
@@ -313,7 +415,8 @@ class GameSaveTree(Tree):
     async def on_click(self, event: Click) -> None:
         # logger.info('on_click(%r)', event)
         if event.widget.id == 'tree' and event.chain % 2 == 0:  # noqa
-            await self.action_edit_value()
+            # Let the click handler return before the edit widgetry runs.
+            self.call_later(self.action_edit_value)
 
     def action_open(self) -> None:
         self.run_worker(self._open())
@@ -324,8 +427,7 @@ class GameSaveTree(Tree):
             file = await self.app.push_screen_wait(FileOpen())
 
         logger.info('Opening to %r', file)
-        with Path(file).open() as file:
-            self.set_gamesave(GameSave.from_json(file))
+        self.set_gamesave(GameSave.from_json(Path(file).read_bytes()))
 
         self.root.expand()
         self.refresh_bindings()
@@ -349,7 +451,7 @@ class GameSaveTree(Tree):
             return
 
         if isinstance(self.selected.data.value, Tristate):
-            self.submit_edit({True: False, False: None, None: True}[self.selected.data.value.value])
+            self.submit_edit(self.selected.data.value.next_value())
         elif isinstance(self.selected.data.value, bool):
             # logger.debug('action_toggle(%s)', self.selected.data.value)
             self.submit_edit(not self.selected.data.value)
@@ -368,7 +470,7 @@ class GameSaveTree(Tree):
             await self.action_toggle_value()
             return
 
-        if data_type in (DeathTypeEnum,):
+        if data_type is DeathTypeEnum:
             await self.app.optionlist.set_options([x.name for x in DeathTypeEnum], self.app.optionlist.ModeEnum.SINGLE)
             self.app.optionlist.options[self.lastDeathType.data.value].set(True)
 
@@ -376,7 +478,7 @@ class GameSaveTree(Tree):
             self.app.optionlist.show()
             return
 
-        if data_type in (StartupPopupsFlag,):
+        if data_type is StartupPopupsFlag:
             await self.app.optionlist.set_options(
                 [x.name for x in StartupPopupsFlag], self.app.optionlist.ModeEnum.MULTI
             )
@@ -410,10 +512,10 @@ class GameSaveTree(Tree):
 
         if data_type is float:
             widget.type = 'numeric'
-            widget.restrict = r'^-?[0-9]*(?:\.[0-9]*)?$'
+            widget.restrict = _FLOAT_RESTRICT
         elif data_type is int:
             widget.type = 'integer'
-            widget.restrict = r'^-?[0-9]*$'
+            widget.restrict = _INT_RESTRICT
         else:
             widget.type = 'text'
             widget.restrict = None
@@ -422,56 +524,51 @@ class GameSaveTree(Tree):
 
     async def action_set_log_state(self, parameter: str) -> None:
         # logger.debug('action_set_log_state(%r)', parameter)
+        fact = self.selected.data.value
+        newly_revealed_ids = self.newlyRevealedFactIDs.data.value
+
         if parameter == 'read':
-            self.selected.data.value.read = not self.selected.data.value.read
+            fact.read = not fact.read
         elif parameter == 'reveal':
-            revealOrder = self.selected.data.value.revealOrder
-            if revealOrder > -1:
+            if fact.revealOrder > -1:
                 self.submit_edit(-1)
-                self.selected.data.value.newlyRevealed = False
-                self.newlyRevealedFactIDs.data.value = [
-                    x for x in self.newlyRevealedFactIDs.data.value if x != self.selected.data.value.id
-                ]
+                fact.newlyRevealed = False
+                try:
+                    newly_revealed_ids.remove(fact.id)
+                except ValueError:
+                    pass
             else:
-                self.submit_edit(max(x.data.value.revealOrder + 1 for x in self.shipLogFactSaves.children))
-                self.selected.data.value.newlyRevealed = True
-                self.newlyRevealedFactIDs.data.value.append(self.selected.data.value.id)
+                self.submit_edit(self._max_reveal_order + 1)
+                fact.newlyRevealed = True
+                newly_revealed_ids.append(fact.id)
         elif parameter == 'new_reveal':
-            self.selected.data.value.newlyRevealed = not self.selected.data.value.newlyRevealed
-            if self.selected.data.value.newlyRevealed:
-                self.newlyRevealedFactIDs.data.value.append(self.selected.data.value.id)
+            fact.newlyRevealed = not fact.newlyRevealed
+            if fact.newlyRevealed:
+                newly_revealed_ids.append(fact.id)
             else:
-                self.newlyRevealedFactIDs.data.value = [
-                    x for x in self.newlyRevealedFactIDs.data.value if x != self.selected.data.value.id
-                ]
+                try:
+                    newly_revealed_ids.remove(fact.id)
+                except ValueError:
+                    pass
         else:
             raise ValueError('action_set_log_state called without "read" nor "reveal"')
 
-        self.update_labels()
+        self.schedule_update_labels()
 
     def action_sort(self, sort_by: str) -> None:
         # logger.info('sorting, sort_by:%r, sorted_by: %r', sort_by, self.sorted_by)
 
-        if sort_by == 'reveal':
-
-            def key(x: object) -> object:
-                return x.data.value.revealOrder
-
-        elif sort_by == 'alpha':
-
-            def key(x: object) -> object:
-                return x.data.value.id
+        if sort_by == self.sorted_by and not self._sort_dirty:
+            return
 
-        else:
+        key = _SORT_KEYS.get(sort_by)
+        if key is None:
             raise ValueError(f'Invalid sort method: {sort_by!r}')
 
         self.sorted_by = sort_by
+        self._sort_dirty = False
 
-        children = list(self.shipLogFactSaves.children)
-        children.sort(key=key, reverse=True)
-        self.shipLogFactSaves._children = []  # pylint: disable=protected-access
-        for node in children:
-            self.shipLogFactSaves._children.insert(0, node)  # pylint: disable=protected-access
+        self.shipLogFactSaves._children.sort(key=key)  # pylint: disable=protected-access
         self._invalidate()
 
         # logger.info(
@@ -480,21 +577,46 @@ class GameSaveTree(Tree):
         self.app.refresh_bindings()
 
         if self.selected:
-            self.scroll_to_node(self.selected)
-
+            # The manual centring below already brings the node into view;
+            # scroll_to_node on top of it would just be a second scroll pass.
             line = self.selected._line  # pylint: disable=protected-access
             visible = self.size.height
             self.scroll_y = max(line - visible // 2, 0)
 
-    def update_labels(self) -> None:
+    def _rebuild_entry_nodes(self) -> None:
+        nodes: list[TreeNode] = []
+
         def helper(node: TreeNode) -> None:
             for child in node.children:
-                if child.data and isinstance(child.data, Entry):
-                    child.set_label(child.data.get_label())
+                if isinstance(child.data, Entry):
+                    nodes.append(child)
                 if len(child.children):
                     helper(child)
 
         helper(self.root)
+        self._entry_nodes = nodes
+
+    def update_labels(self) -> None:
+        for node in self._entry_nodes:
+            entry = node.data
+            label = entry.get_label()
+            # get_label returns the cached Text until the entry changes, so an
+            # identity check is enough to skip set_label (and the node refresh
+            # it queues) for untouched entries.
+            if label is entry._label_applied:  # pylint: disable=protected-access
+                continue
+            entry._label_applied = label  # pylint: disable=protected-access
+            node.set_label(label)
+
+    def schedule_update_labels(self) -> None:
+        # Coalesce bursts of edits into a single relabel pass after refresh.
+        if not self._labels_scheduled:
+            self._labels_scheduled = True
+            self.call_after_refresh(self._flush_update_labels)
+
+    def _flush_update_labels(self) -> None:
+        self._labels_scheduled = False
+        self.update_labels()
 
     def action_submit(self) -> None:
         # logger.debug('action_edit(%s)', self.app.optionlist.index)
@@ -507,13 +629,17 @@ class GameSaveTree(Tree):
                 self.submit_edit(DeathTypeEnum(self.app.optionlist.index))
             elif isinstance(self.selected.data.value, StartupPopupsFlag):
                 val = StartupPopupsFlag.NONE
-                for n, option in enumerate(self.app.optionlist.options):
-                    val |= int(option.value) << n
+                for (mask, _), option in zip(_POPUPS, self.app.optionlist.options):
+                    if option.value:
+                        val |= mask
                 self.submit_edit(val)
         self.app.optionlist.hide()
         self.app.hide_editbox()
         self.focus()
 
+    def _validate_reveal_order(self, value: str) -> bool:
+        return -1 <= int(value) <= self._max_reveal_order + 1
+
     def submit_edit(self, new_value: object = None) -> None:
         # logger.debug('edit(%s)', new_value)
         if self.selected is None or self.selected.data is None or not isinstance(self.selected.data, Entry):
@@ -526,32 +652,40 @@ class GameSaveTree(Tree):
             self.selected.data.value = float(new_value)
         elif data_type is str:
             self.selected.data.value = str(new_value)
-        elif data_type in (bool, Tristate, DeathTypeEnum, StartupPopupsFlag):
+        elif data_type in _CAST_TYPES:
             self.selected.data.value = data_type(new_value)
         elif isinstance(self.selected.data.value, ShipLogFactSave):
             old_value = self.selected.data.value.revealOrder
             new_value = int(new_value)
-            n = c = 0
-            for fact in sorted(self.shipLogFactSaves.children, key=lambda x: x.data.value.revealOrder):
-                if fact.data.value.revealOrder == -1:
-                    continue
+            children = self.shipLogFactSaves._children  # pylint: disable=protected-access
+            if self.sorted_by == 'reveal' and not self._sort_dirty:
+                # action_sort keeps the children reveal-ordered already.
+                ordered = children
+            else:
+                ordered = sorted(children, key=lambda x: x.data.value.revealOrder)
 
-                if fact.data.value.revealOrder == old_value:
+            c = 0
+            for fact in ordered:
+                value = fact.data.value
+                if value.revealOrder in (-1, old_value):
                     continue
                 if c == new_value:
                     c += 1
-                fact.data.value.revealOrder = c
+                value.revealOrder = c
                 c += 1
-                n += 1
 
-            new_value = min(new_value, max(x.data.value.revealOrder + 1 for x in self.shipLogFactSaves.children))
+            new_value = min(new_value, max(x.data.value.revealOrder + 1 for x in children))
             self.selected.data.value.revealOrder = new_value
+            self._max_reveal_order = max(x.data.value.revealOrder for x in children)
+            self._sort_dirty = True
+            # The renumber only moved the selected fact; Timsort finishes the
+            # nearly-sorted list in linear time.
             self.action_sort(self.sorted_by)
 
         else:
             raise ValueError('Trying to set value of a Entry with unsure base type')
 
-        self.update_labels()
+        self.schedule_update_labels()
 
         self.app.hide_editbox()
 
@@ -568,43 +702,38 @@ class GameSaveTree(Tree):
 
         self.loopCount.data.value = gamesave.loopCount
 
-        for frequency, node in product(gamesave.knownFrequencies, self.knownFrequencies.children):
-            if not isinstance(node.data, Entry):
-                raise ValueError('frequency <node>.data must be an Entry')
-            if node.data.name == frequency.name:
-                node.data.value = gamesave.knownFrequencies[frequency]
+        for frequency, value in gamesave.knownFrequencies.items():
+            node = self._freq_nodes.get(frequency.name)
+            if node:
+                node.data.value = value
+
+        for signal, value in gamesave.knownSignals.items():
+            node = self._signal_nodes.get(signal.name)
+            if node:
+                node.data.value = value
 
-        for signal, node in product(gamesave.knownSignals, self.knownSignals.children):
-            if not isinstance(node.data, Entry):
-                raise ValueError('knownSignal <node>.data must be an Entry')
-            if node.data.name == signal.name:
-                node.data.value = gamesave.knownSignals[signal]
+        for condition, value in gamesave.dictConditions.items():
+            node = self._condition_nodes.get(condition)
+            if node:
+                node.data.value = value
 
-        for condition, node in product(gamesave.dictConditions, self.dictConditions.children):
-            if not isinstance(node.data, Entry):
-                raise ValueError('dictCondition <node>.data must be an Entry')
-            if node.data.name == condition:
-                node.data.value = gamesave.dictConditions[condition]
+        self._max_reveal_order = max((v.revealOrder for v in gamesave.shipLogFactSaves.values()), default=-1)
 
         self.shipLogFactSaves.remove_children()
-        for k, v in sorted(gamesave.shipLogFactSaves.items(), key=lambda x: x[1].revealOrder):
-            node = self.shipLogFactSaves.add_leaf(k)
-            node.data = EntrySaveLogFact(
-                k,
-                v,
-                validator=Function(
-                    lambda x: -1
-                    <= int(x)
-                    <= max(
-                        x.data.value.revealOrder + 1 if x.data is not None else 0
-                        for x in self.shipLogFactSaves.children
-                    ),
-                    'Out of range',
-                ),
-            )
+        # Tuple comparison runs entirely in C; the unique id breaks revealOrder
+        # ties so the ShipLogFactSave itself is never compared.
+        facts = [(v.revealOrder, k, v) for k, v in gamesave.shipLogFactSaves.items()]
+        facts.sort()
+        self._add_leaves(
+            self.shipLogFactSaves,
+            ((k, EntrySaveLogFact(k, v, validator=self._reveal_order_validator)) for _, k, v in facts),
+        )
         #  for n, node in enumerate(self.shipLogFactSaves.children):
         #  node.data.value = gamesave.shipLogFactSaves[node.data.name]
 
+        # Leaves were rebuilt in reveal order; flag a pending re-sort otherwise.
+        self._sort_dirty = self.sorted_by != 'reveal'
+
         # self.newlyRevealedFactIDs: list[str] = []
         self.newlyRevealedFactIDs.data.value = gamesave.newlyRevealedFactIDs
         self.lastDeathType.data.value = gamesave.lastDeathType
@@ -620,6 +749,7 @@ class GameSaveTree(Tree):
         self.ps5Activity_availableShipLogCards.data.value = gamesave.ps5Activity_availableShipLogCards
         self.didRunInitGammaSetting.data.value = gamesave.didRunInitGammaSetting
 
+        self._rebuild_entry_nodes()
         self.update_labels()
 
     def update_gamesave(self) -> bool:
@@ -628,16 +758,19 @@ class GameSaveTree(Tree):
 
         self.gamesave.loopCount = self.loopCount.data.value
 
-        for frequency, node in product(self.gamesave.knownFrequencies, self.knownFrequencies.children):
-            if node.data.name == frequency.name:
+        for frequency in self.gamesave.knownFrequencies:
+            node = self._freq_nodes.get(frequency.name)
+            if node:
                 self.gamesave.knownFrequencies[frequency] = node.data.value
 
-        for signal, node in product(self.gamesave.knownSignals, self.knownSignals.children):
-            if node.data.name == signal.name:
+        for signal in self.gamesave.knownSignals:
+            node = self._signal_nodes.get(signal.name)
+            if node:
                 self.gamesave.knownSignals[signal] = node.data.value
 
-        for condition, node in product(self.gamesave.dictConditions, self.dictConditions.children):
-            if node.data.name == condition:
+        for condition in self.gamesave.dictConditions:
+            node = self._condition_nodes.get(condition)
+            if node:
                 self.gamesave.dictConditions[condition] = node.data.value
 
         self.gamesave.shipLogFactSaves = {}
@@ -47,7 +47,7 @@ class OptionList(ListView):
 
     async def on_click(self, event: Click) -> None:
         if event.chain == 2:  # noqa
-            self.action_toggle()
+            self.call_later(self.action_toggle)
 
     def on_blur(self) -> None:
         self.hide()